@@ -3,16 +3,17 @@
 Uniden Frequency Scanner USB Device Detection Module
 
 This module provides a class-based implementation for detecting a connected Uniden
-frequency scanner USB device. Update the vendor and product IDs as necessary.
+frequency scanner USB device. Update the vendor and product IDs in uniden_core as necessary.
 All comments and log messages are in English.
 """
 
 import logging
 import sys
 
-import usb.core
 import usb.util
 
+from uniden_core import get_device
+
 # Setup detailed logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -25,9 +26,7 @@ class UnidenDevice:
     """
     Class to manage the Uniden frequency scanner USB device.
     """
-    # Device identifiers (update these values based on your device)
-    VENDOR_ID = 0x1965
-    PRODUCT_ID = 0x0018
+    __slots__ = ('device',)
 
     def __init__(self) -> None:
         """
@@ -35,11 +34,14 @@ class UnidenDevice:
         Exits the program if the device is not found.
         """
         logging.info("Searching for Uniden frequency scanner USB device...")
-        self.device = usb.core.find(idVendor=self.VENDOR_ID, idProduct=self.PRODUCT_ID)
+        self.device = get_device()
         if self.device is None:
-            logging.error("Uniden device not found. Check USB connection and device IDs.")
+            logging.error("Uniden device not found. Check USB connection and device IDs in uniden_core.")
             sys.exit(1)
-        logging.info(f"Found Uniden USB device: Vendor ID={hex(self.VENDOR_ID)}, Product ID={hex(self.PRODUCT_ID)}")
+        logging.info(
+            f"Found Uniden USB device: Vendor ID={hex(self.device.idVendor)}, "
+            f"Product ID={hex(self.device.idProduct)}"
+        )
 
     def initialize(self) -> None:
         """
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Uniden UBC125XLT Asynchronous USB Communication Module
+
+This module communicates with the Uniden UBC125XLT frequency scanner through libusb1
+asynchronous bulk transfers (python-libusb1, "pip install libusb1") driven by an asyncio
+event loop. Transfers are submitted immediately and their completion is signalled by
+libusb callbacks, so no fixed delay is needed between a command and its response.
+All comments and log messages are in English.
+"""
+
+import asyncio
+import collections
+import logging
+import select
+import time
+
+import usb1
+
+from uniden_core import UnidenUBC125XLT
+
+# Setup detailed logging
+logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s")
+
+
+class UnidenAsync:
+    """
+    Class to manage asynchronous communication with the Uniden UBC125XLT frequency scanner.
+    """
+    VENDOR_ID = UnidenUBC125XLT.VENDOR_ID
+    PRODUCT_ID = UnidenUBC125XLT.PRODUCT_ID
+    CONFIGURATION = UnidenUBC125XLT.CONFIGURATION
+    INTERFACE = UnidenUBC125XLT.INTERFACE
+    ENDPOINT_IN = UnidenUBC125XLT.ENDPOINT_IN
+    ENDPOINT_OUT = UnidenUBC125XLT.ENDPOINT_OUT
+    TIMEOUT = UnidenUBC125XLT.TIMEOUT
+    READ_SIZE = 128
+    CLEAR_TRANSFERS = 8  # IN transfers kept in flight while draining
+    CLEAR_SIZE = 256
+    CLEAR_TIMEOUT = 50  # ms
+
+    def __init__(self) -> None:
+        """
+        Open the Uniden UBC125XLT device through a libusb1 context.
+        Raises:
+            ValueError: if the device is not found.
+        """
+        self.loop = None
+        # Framed commands: {command: CR-terminated bytes}
+        self._cmd_cache = {}
+        # Shared IN stream: received bytes not yet split into records, and the futures
+        # waiting for the next records in command order
+        self._rx = bytearray()
+        self._waiting = collections.deque()
+        self._reader = None
+        self.context = usb1.USBContext()
+        self.handle = self.context.openByVendorIDAndProductID(
+            self.VENDOR_ID,
+            self.PRODUCT_ID,
+            skip_on_error=True,
+        )
+        if self.handle is None:
+            self.context.close()
+            raise ValueError("Uniden UBC125XLT not found.")
+        logging.info("Device found.")
+
+    def initialize(self) -> None:
+        """
+        Claim the USB interface and hook the libusb file descriptors into the running
+        asyncio event loop. Must be called from a coroutine.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.handle.setAutoDetachKernelDriver(True)
+        if self.handle.getConfiguration() != self.CONFIGURATION:
+            self.handle.setConfiguration(self.CONFIGURATION)
+        self.handle.claimInterface(self.INTERFACE)
+
+        for fd, events in self.context.getPollFDList():
+            self._add_pollfd(fd, events)
+        self.context.setPollFDNotifiers(self._add_pollfd, self._remove_pollfd)
+        logging.info("Device initialized successfully.")
+        self.clear_buffer()
+
+        self._reader = self.handle.getTransfer()
+        self._reader.setBulk(
+            self.ENDPOINT_IN,
+            self.READ_SIZE,
+            callback=self._on_read_done,
+            timeout=self.TIMEOUT,
+        )
+
+    def clear_buffer(self) -> None:
+        """
+        Drain stale data from the IN endpoint. Several bulk reads are kept in flight and
+        re-submitted on completion; libusb events are only handled when its file descriptors
+        poll ready, and draining stops as soon as a poll window passes without activity.
+        """
+        logging.info("Clearing device buffer...")
+        draining = True
+
+        def on_done(transfer: usb1.USBTransfer) -> None:
+            nonlocal draining
+            if transfer.getStatus() == usb1.TRANSFER_COMPLETED:
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    data = transfer.getBuffer()[:transfer.getActualLength()]
+                    logging.debug("Cleared buffered data: %s", bytes(data))
+                if draining:
+                    transfer.submit()
+            else:
+                # Timed out, cancelled or device gone: the endpoint is empty.
+                draining = False
+
+        transfers = []
+        for _ in range(self.CLEAR_TRANSFERS):
+            transfer = self.handle.getTransfer()
+            transfer.setBulk(
+                self.ENDPOINT_IN,
+                self.CLEAR_SIZE,
+                callback=on_done,
+                timeout=self.CLEAR_TIMEOUT,
+            )
+            transfer.submit()
+            transfers.append(transfer)
+
+        poller = select.poll()
+        for fd, events in self.context.getPollFDList():
+            poller.register(fd, events)
+
+        deadline = time.monotonic() + self.CLEAR_TIMEOUT / 1000
+        while any(transfer.isSubmitted() for transfer in transfers):
+            if draining and not poller.poll(self.CLEAR_TIMEOUT):
+                # No USB activity within the poll window: the endpoint is empty.
+                draining = False
+            if draining and time.monotonic() < deadline:
+                self.context.handleEventsTimeout(0)
+                continue
+            draining = False
+            for transfer in transfers:
+                if transfer.isSubmitted():
+                    try:
+                        transfer.cancel()
+                    except usb1.USBErrorNotFound:
+                        pass
+            self.context.handleEventsTimeout(self.CLEAR_TIMEOUT / 1000)
+
+        for transfer in transfers:
+            transfer.close()
+        logging.info("Buffer cleared.")
+
+    def _add_pollfd(self, fd: int, events: int, user_data=None) -> None:
+        if events & select.POLLIN:
+            self.loop.add_reader(fd, self._handle_events)
+        if events & select.POLLOUT:
+            self.loop.add_writer(fd, self._handle_events)
+
+    def _remove_pollfd(self, fd: int, user_data=None) -> None:
+        self.loop.remove_reader(fd)
+        self.loop.remove_writer(fd)
+
+    def _handle_events(self) -> None:
+        self.context.handleEventsTimeout(0)
+
+    @staticmethod
+    def _on_transfer_done(transfer: usb1.USBTransfer) -> None:
+        """
+        libusb completion callback: resolve the future attached to the transfer.
+        """
+        future = transfer.getUserData()
+        if future.done():
+            return
+        status = transfer.getStatus()
+        if status == usb1.TRANSFER_COMPLETED:
+            future.set_result(bytes(transfer.getBuffer()[:transfer.getActualLength()]))
+        elif status == usb1.TRANSFER_TIMED_OUT:
+            future.set_exception(usb1.USBErrorTimeout())
+        elif status == usb1.TRANSFER_NO_DEVICE:
+            future.set_exception(usb1.USBErrorNoDevice())
+        else:
+            future.set_exception(usb1.USBErrorIO())
+
+    def _on_read_done(self, transfer: usb1.USBTransfer) -> None:
+        """
+        libusb completion callback of the shared IN reader: split the stream on CR and
+        resolve the waiting futures in command order.
+        """
+        status = transfer.getStatus()
+        if status != usb1.TRANSFER_COMPLETED:
+            if status == usb1.TRANSFER_TIMED_OUT:
+                error = usb1.USBErrorTimeout()
+            elif status == usb1.TRANSFER_NO_DEVICE:
+                error = usb1.USBErrorNoDevice()
+            else:
+                error = usb1.USBErrorIO()
+            # A missing reply would shift every later one, so fail all waiting commands.
+            self._rx.clear()
+            while self._waiting:
+                future = self._waiting.popleft()
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        self._rx += transfer.getBuffer()[:transfer.getActualLength()]
+        *records, self._rx = self._rx.split(b'\r')
+        for record in records:
+            record = record.strip()
+            if not record:
+                continue
+            if not self._waiting:
+                logging.warning("Discarding unsolicited response: %r", bytes(record))
+                continue
+            future = self._waiting.popleft()
+            # A cancelled caller still consumes its record to keep the order intact.
+            if not future.done():
+                future.set_result(bytes(record))
+        if self._waiting:
+            self._start_reader()
+
+    def _on_sent(self, sent: asyncio.Future, received: asyncio.Future) -> None:
+        """
+        Done callback of an OUT transfer: withdraw its reply from the queue if it failed.
+        """
+        if sent.cancelled() or sent.exception() is not None:
+            # The command never reached the device, so no reply will arrive for it.
+            if received in self._waiting:
+                self._waiting.remove(received)
+
+    def _start_reader(self) -> None:
+        """
+        Submit the shared IN reader unless it is already in flight.
+        """
+        if not self._reader.isSubmitted():
+            self._reader.submit()
+            self.loop.call_later(self.TIMEOUT / 1000, self._handle_events)
+
+    def _submit(self, endpoint: int, data_or_length) -> asyncio.Future:
+        """
+        Submit a bulk transfer and return a future resolved on its completion.
+
+        Parameters:
+            endpoint (int): Endpoint address.
+            data_or_length: Bytes to send (OUT) or number of bytes to read (IN).
+
+        Returns:
+            asyncio.Future: Resolves to the transferred bytes.
+        """
+        future = self.loop.create_future()
+        transfer = self.handle.getTransfer()
+        transfer.setBulk(
+            endpoint,
+            data_or_length,
+            callback=self._on_transfer_done,
+            user_data=future,
+            timeout=self.TIMEOUT,
+        )
+        transfer.submit()
+        # Timeouts only surface through the poll fds on platforms with timerfd support.
+        self.loop.call_later(self.TIMEOUT / 1000, self._handle_events)
+        return future
+
+    async def send_command(self, cmd: str) -> str:
+        """
+        Send a command to the device and return the response.
+
+        Concurrent calls pipeline on the bus: each OUT transfer is submitted at once and
+        its reply is taken from a single IN stream shared by all commands. The stream is
+        split on CR, so replies packed into one packet or spread over several transfers
+        are still paired with their commands in submission order.
+
+        Parameters:
+            cmd (str): Command string to send.
+
+        Returns:
+            str: The device response.
+        """
+        full_cmd = self._cmd_cache.get(cmd)
+        if full_cmd is None:
+            full_cmd = self._cmd_cache[cmd] = cmd.strip().encode('ascii') + b'\r'
+        logging.debug("Sending command: '%s'", cmd)
+        received = self.loop.create_future()
+        sent = self._submit(self.ENDPOINT_OUT, full_cmd)
+        # Queue the reply only once the OUT transfer is submitted; a synchronous submit
+        # failure above leaves nothing behind to take another command's reply.
+        self._waiting.append(received)
+        sent.add_done_callback(lambda future: self._on_sent(future, received))
+        try:
+            self._start_reader()
+            # Shielded so a cancelled caller still learns whether the command went out.
+            await asyncio.shield(sent)
+            response = await received
+        except BaseException:
+            # A cancelled or failed caller still consumes its record to keep the order intact.
+            received.cancel()
+            raise
+        response_text = response.rstrip(b'\r\n ').decode('ascii', errors='replace')
+        logging.debug("Received response: '%s'", response_text)
+        return response_text
+
+    async def get_channel_infos(self, channels: list) -> dict:
+        """
+        Fetch the information of several channels with all requests in flight at once.
+
+        Parameters:
+            channels (list): Channel numbers to query.
+
+        Returns:
+            dict: Channel number mapped to its channel details.
+        """
+        responses = await asyncio.gather(*(self.send_command(f"PM {channel}") for channel in channels))
+        return dict(zip(channels, responses))
+
+    def close(self) -> None:
+        """
+        Release the USB interface and close the libusb handle and context.
+        """
+        if self._reader is not None:
+            if self._reader.isSubmitted():
+                try:
+                    self._reader.cancel()
+                except usb1.USBErrorNotFound:
+                    pass
+            while self._reader.isSubmitted():
+                self.context.handleEventsTimeout(self.CLEAR_TIMEOUT / 1000)
+            self._reader.close()
+        if self.loop is not None:
+            self.context.setPollFDNotifiers()
+            for fd, _ in self.context.getPollFDList():
+                self._remove_pollfd(fd)
+            self.handle.releaseInterface(self.INTERFACE)
+        self.handle.close()
+        self.context.close()
+        logging.info("Device closed properly.")
+
+
+async def main() -> None:
+    scanner = UnidenAsync()
+    try:
+        scanner.initialize()
+
+        model = await scanner.send_command("MDL")
+        logging.info(f"Model: {model}")
+
+        channel_infos = await scanner.get_channel_infos(list(range(1, 11)))
+        for channel_number, channel_info in channel_infos.items():
+            logging.info(f"Channel {channel_number} info: {channel_info}")
+    except Exception as e:
+        logging.error(f"An error occurred: {e}")
+    finally:
+        scanner.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
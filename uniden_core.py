@@ -0,0 +1,388 @@
+"""
+Uniden UBC125XLT Shared USB Helpers
+
+This module holds the pieces shared by the Uniden scanner scripts: the UnidenUBC125XLT
+communication class, a cached USB device lookup so that every instance in the same
+interpreter reuses a single usb.core.find result instead of walking the bus again, and
+scanner_session, which keeps the interface claimed for the lifetime of the interpreter.
+All comments and log messages are in English.
+"""
+
+import array
+import atexit
+import logging
+import time
+from contextlib import contextmanager
+
+import usb.core
+import usb.util
+
+VENDOR_ID = 0x1965
+PRODUCT_ID = 0x0018
+
+_device = None
+_session = None
+
+
+def get_device():
+    """
+    Return the Uniden scanner USB device, searching the bus only until it is found.
+
+    Returns:
+        usb.core.Device: The scanner, or None if it is not connected.
+    """
+    global _device
+    if _device is None:
+        _device = usb.core.find(idVendor=VENDOR_ID, idProduct=PRODUCT_ID)
+    return _device
+
+
+class UnidenUBC125XLT:
+    """
+    Class to manage communication with the Uniden UBC125XLT frequency scanner via USB.
+    """
+    VENDOR_ID = VENDOR_ID
+    PRODUCT_ID = PRODUCT_ID
+    CONFIGURATION = 1
+    COMM_INTERFACE = 0  # CDC Communication interface (#0), carries the notification endpoint
+    INTERFACE = 1  # using CDC Data interface (#1)
+    ENDPOINT_IN = 0x81
+    ENDPOINT_OUT = 0x02
+    TIMEOUT = 5000  # ms
+    READ_TIMEOUT = 50  # ms, for continuation packets of a started response
+    CLEAR_PACKETS = 16  # wMaxPacketSize units drained by clear_buffer
+    CLEAR_TIMEOUT = 20  # ms
+    CACHE_TTL = 500  # ms
+    # Read-only queries whose replies may be served from the response cache
+    CACHEABLE_COMMANDS = frozenset({
+        "MDL", "VER", "VOL", "SQL", "SQ", "BAT", "BLT", "STS", "GLG", "CIN", "PM", "RF",
+    })
+    NOTIFY_TIMEOUT = 200  # ms
+
+    __slots__ = (
+        'device', 'ep_in', 'ep_out', 'max_packet_size', '_cmd_cache', '_cmd_buf', '_resp_buf',
+        '_cache', '_cache_enabled', '_cache_ttl', '_notify_ep',
+    )
+
+    def __init__(self) -> None:
+        """
+        Locate the Uniden UBC125XLT device on the USB bus.
+        Raises:
+            ValueError: if the device is not found.
+        """
+        self.device = get_device()
+        if self.device is None:
+            raise ValueError("Uniden UBC125XLT not found.")
+        logging.info("Device found.")
+        # Framed commands: {command: CR-terminated array.array}
+        self._cmd_cache = {}
+        # Reusable transfer buffers: pyusb passes array.array objects through without copying.
+        self._cmd_buf = array.array('B')
+        self._resp_buf = array.array('B', bytes(256))
+        # Response cache: {command: (response, monotonic deadline)}
+        self._cache = {}
+        self._cache_enabled = True
+        self._cache_ttl = self.CACHE_TTL / 1000
+        # CDC notification endpoint address, looked up on first wait_for_notification
+        self._notify_ep = None
+
+    def initialize(self) -> None:
+        """
+        Initialize the device by detaching any active kernel driver, setting the configuration,
+        claiming the USB interface and clearing stale data from the IN endpoint.
+        """
+        if self.device.is_kernel_driver_active(self.INTERFACE):
+            self.device.detach_kernel_driver(self.INTERFACE)
+            logging.debug("Detached kernel driver.")
+        self.device.set_configuration(self.CONFIGURATION)
+        usb.util.claim_interface(self.device, self.INTERFACE)
+        # Keep the endpoint objects so transfers skip the per-call endpoint lookup.
+        intf = self.device.get_active_configuration()[(self.INTERFACE, 0)]
+        self.ep_in = usb.util.find_descriptor(intf, bEndpointAddress=self.ENDPOINT_IN)
+        self.ep_out = usb.util.find_descriptor(intf, bEndpointAddress=self.ENDPOINT_OUT)
+        self.max_packet_size = self.ep_in.wMaxPacketSize
+        # IN reads must be a multiple of wMaxPacketSize to avoid overflow errors.
+        if len(self._resp_buf) % self.max_packet_size:
+            self._resp_buf = array.array('B', bytes(self.max_packet_size))
+        logging.info("Device initialized successfully.")
+        self.clear_buffer()
+
+    def clear_buffer(self) -> None:
+        """
+        Clear a halted IN endpoint and drain any buffered data. Each stale reply usually
+        arrives as its own short packet, so reads repeat until one times out.
+        """
+        logging.info("Clearing device buffer...")
+        self.device.clear_halt(self.ENDPOINT_IN)
+        try:
+            while True:
+                data = self.ep_in.read(self.CLEAR_PACKETS * self.max_packet_size, timeout=self.CLEAR_TIMEOUT)
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Cleared buffered data: %s", bytes(data))
+        except usb.core.USBTimeoutError:
+            pass
+        except usb.core.USBError as e:
+            logging.error(f"USB error clearing buffer: {e}")
+            return
+        logging.info("Buffer cleared.")
+
+    def send_command(self, cmd: str) -> str:
+        """
+        Send a command to the device and return the response.
+
+        Parameters:
+            cmd (str): Command string to send.
+
+        Returns:
+            str: The device response.
+        """
+        return self.send_command_bytes(cmd).decode('ascii', errors='replace')
+
+    def send_command_bytes(self, cmd: str) -> bytes:
+        """
+        Send a command to the device and return the raw response without decoding it.
+
+        Parameters:
+            cmd (str): Command string to send.
+
+        Returns:
+            bytes: The device response with the line terminator removed.
+        """
+        cacheable = self._cache_enabled and self._is_cacheable(cmd)
+        if not cacheable:
+            # Any other command may change the scanner state, so every cached response is stale.
+            self._cache.clear()
+        else:
+            cached = self._cache.get(cmd)
+            if cached is not None and time.monotonic() < cached[1]:
+                logging.debug("Cached response: %r", cached[0])
+                return cached[0]
+
+        logging.debug("Sending command: '%s'", cmd)
+        self.ep_out.write(self._frame(cmd), timeout=self.TIMEOUT)
+        response, terminated = self._read_response()
+        response = bytes(response.rstrip(b'\r\n '))
+        # Without the carriage return the response may be incomplete; attempt to read additional data.
+        if not terminated:
+            try:
+                length = self.ep_in.read(self._resp_buf, timeout=1000)
+                response += self._resp_buf[:length].tobytes().rstrip(b'\r\n ')
+                logging.debug("Appended extra response data.")
+            except usb.core.USBError:
+                logging.debug("No extra response data available.")
+        logging.debug("Received response: %r", response)
+        if cacheable:
+            self._cache[cmd] = (response, time.monotonic() + self._cache_ttl)
+        return response
+
+    def send_commands(self, cmds: list) -> list:
+        """
+        Send several commands in a single bulk write and return their responses in order.
+        Falls back to one exchange per command if the device does not answer the batch.
+
+        Parameters:
+            cmds (list): Command strings to send.
+
+        Returns:
+            list: The device responses, one per command.
+        """
+        # Blank commands would put an empty record on the wire and get no reply of their own.
+        cmds = [cmd for cmd in (cmd.strip() for cmd in cmds) if cmd]
+        if not cmds:
+            return []
+        del self._cmd_buf[:]
+        self._cmd_buf.frombytes(('\r'.join(cmds) + '\r').encode('ascii'))
+        self.ep_out.write(self._cmd_buf, timeout=self.TIMEOUT)
+        logging.debug("Sent batch: %s", cmds)
+
+        responses = []
+        pending = bytearray()
+        try:
+            while len(responses) < len(cmds):
+                # Once the first record is in, firmware that ignores the rest must not cost TIMEOUT.
+                timeout = self.READ_TIMEOUT if responses else self.TIMEOUT
+                length = self.ep_in.read(self._resp_buf, timeout=timeout)
+                pending += self._resp_buf[:length].tobytes()
+                *records, pending = pending.split(b'\r')
+                responses.extend(bytes(r.strip()) for r in records if r.strip())
+        except usb.core.USBTimeoutError:
+            logging.debug("Batch response incomplete.")
+
+        # Responses echo the command name; anything else means the batch was not understood.
+        command_name = cmds[0].replace(',', ' ').split()[0]
+        if len(responses) != len(cmds) or not responses[0].startswith(command_name.encode('ascii')):
+            logging.debug("Device rejected batched commands, sending one by one.")
+            # Discard records of the failed batch that are still queued or arriving.
+            self.clear_buffer()
+            return [self.send_command(cmd) for cmd in cmds]
+
+        logging.debug("Batch responses: %s", responses)
+        if not all(self._is_cacheable(cmd) for cmd in cmds):
+            self._cache.clear()
+        elif self._cache_enabled:
+            deadline = time.monotonic() + self._cache_ttl
+            self._cache.update((cmd, (response, deadline)) for cmd, response in zip(cmds, responses))
+        return [response.decode('ascii', errors='replace') for response in responses]
+
+    def set_cache(self, enabled: bool, ttl_ms: int = CACHE_TTL) -> None:
+        """
+        Configure the response cache used by send_command.
+
+        Parameters:
+            enabled (bool): Whether responses are cached.
+            ttl_ms (int): How long a cached response stays valid, in milliseconds.
+        """
+        self._cache_enabled = enabled
+        self._cache_ttl = ttl_ms / 1000
+        self._cache.clear()
+
+    def _is_cacheable(self, cmd: str) -> bool:
+        """
+        Return True for read-only queries on the allowlist. Commands carrying comma-separated
+        arguments set values and are never cached.
+        """
+        parts = cmd.split()
+        return bool(parts) and ',' not in cmd and parts[0] in self.CACHEABLE_COMMANDS
+
+    def wait_for_notification(self, timeout: int = NOTIFY_TIMEOUT) -> None:
+        """
+        Wait on the CDC interrupt notification endpoint instead of sleeping between commands.
+        Returns as soon as the device sends a notification, or when the timeout expires.
+
+        Parameters:
+            timeout (int): Maximum time to wait, in milliseconds.
+        """
+        if self._notify_ep is None:
+            intf = self.device.get_active_configuration()[(self.COMM_INTERFACE, 0)]
+            endpoint = usb.util.find_descriptor(
+                intf,
+                custom_match=lambda e:
+                    usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_IN
+                    and usb.util.endpoint_type(e.bmAttributes) == usb.util.ENDPOINT_TYPE_INTR
+            )
+            if endpoint is None:
+                # No notification endpoint: fall back to a plain delay.
+                self._notify_ep = 0
+            else:
+                try:
+                    if self.device.is_kernel_driver_active(self.COMM_INTERFACE):
+                        self.device.detach_kernel_driver(self.COMM_INTERFACE)
+                    usb.util.claim_interface(self.device, self.COMM_INTERFACE)
+                except usb.core.USBError as e:
+                    # Interface unavailable: fall back to a plain delay instead of retrying.
+                    logging.warning(f"Cannot claim notification interface: {e}")
+                    self._notify_ep = 0
+                else:
+                    self._notify_ep = endpoint.bEndpointAddress
+                    logging.debug("Using notification endpoint %s.", hex(self._notify_ep))
+
+        if not self._notify_ep:
+            time.sleep(timeout / 1000)
+            return
+        try:
+            self.device.read(self._notify_ep, 16, timeout=timeout)
+        except usb.core.USBError:
+            pass
+
+    def _frame(self, cmd: str) -> array.array:
+        """
+        Return the CR-terminated wire form of a command, building it on first use.
+        """
+        frame = self._cmd_cache.get(cmd)
+        if frame is None:
+            frame = self._cmd_cache[cmd] = array.array('B', cmd.strip().encode('ascii') + b'\r')
+        return frame
+
+    def _read_response(self) -> tuple:
+        """
+        Read one response, stopping at the carriage return terminator or at a short packet
+        instead of waiting a fixed delay for the device to finish.
+
+        Returns:
+            tuple: The response bytes and whether the carriage return terminator was seen.
+        """
+        response = bytearray()
+        timeout = self.TIMEOUT
+        while True:
+            try:
+                length = self.ep_in.read(self._resp_buf, timeout=timeout)
+            except usb.core.USBTimeoutError:
+                if not response:
+                    raise
+                break
+            response += self._resp_buf[:length].tobytes()
+            if b'\r' in response:
+                return response, True
+            if length < len(self._resp_buf):
+                break
+            timeout = self.READ_TIMEOUT
+        return response, False
+
+    def get_model(self) -> str:
+        """
+        Get the device model by sending the "MDL" command.
+
+        Returns:
+            str: The device model.
+        """
+        return self.send_command("MDL")
+
+    def get_channel_frequency(self, channel: int) -> str:
+        """
+        Get the frequency for a specified channel.
+
+        Parameters:
+            channel (int): The channel number.
+
+        Returns:
+            str: The frequency as a string.
+        """
+        return self.send_command(f"RF {channel}")
+
+    def get_channel_info(self, channel: int) -> str:
+        """
+        Get detailed information about a specified channel.
+
+        Parameters:
+            channel (int): The channel number.
+
+        Returns:
+            str: Channel details.
+        """
+        return self.send_command(f"PM {channel}")
+
+    def close(self) -> None:
+        """
+        Release the USB interface and dispose of device resources.
+        """
+        if self._notify_ep:
+            usb.util.release_interface(self.device, self.COMM_INTERFACE)
+        usb.util.release_interface(self.device, self.INTERFACE)
+        usb.util.dispose_resources(self.device)
+        logging.info("Device closed properly.")
+
+
+@contextmanager
+def scanner_session():
+    """
+    Provide an initialized scanner that stays claimed for the rest of the interpreter session.
+
+    The first session creates and initializes the scanner; later sessions reuse the same
+    instance. Leaving the block does not release the interface, the scanner is closed once
+    at interpreter shutdown.
+
+    Yields:
+        UnidenUBC125XLT: The initialized scanner instance.
+    """
+    global _session
+    if _session is None:
+        scanner = UnidenUBC125XLT()
+        try:
+            scanner.initialize()
+        except Exception:
+            # initialize() may fail after claiming the interface; release it before re-raising.
+            scanner.close()
+            raise
+        _session = scanner
+        atexit.register(scanner.close)
+    yield _session
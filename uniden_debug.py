@@ -4,94 +4,91 @@ Uniden UBC125XLT Debug Tool (with USB buffer clearing)
 
 This script sends multiple commands to the scanner and ensures
 responses match sent commands by clearing buffers before use.
+Run with --async to pipeline the commands over libusb1 asynchronous transfers.
 """
 
+import asyncio
 import logging
-import time
+import sys
 
 import usb.core
-import usb.util
+
+from uniden_core import UnidenUBC125XLT, scanner_session
 
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
-
-class UnidenUBC125XLT:
-    VENDOR_ID = 0x1965
-    PRODUCT_ID = 0x0018
-    CONFIGURATION = 1
-    INTERFACE = 1
-    ENDPOINT_IN = 0x81
-    ENDPOINT_OUT = 0x02
-    TIMEOUT = 5000
-
-    def __init__(self) -> None:
-        self.device = usb.core.find(idVendor=self.VENDOR_ID, idProduct=self.PRODUCT_ID)
-        if self.device is None:
-            raise ValueError("Device not found")
-        logging.info("Uniden UBC125XLT device located.")
-
-    def initialize(self) -> None:
-        if self.device.is_kernel_driver_active(self.INTERFACE):
-            self.device.detach_kernel_driver(self.INTERFACE)
-            logging.debug("Detached kernel driver.")
-        self.device.set_configuration(self.CONFIGURATION)
-        usb.util.claim_interface(self.device, self.INTERFACE)
-        logging.info("Device initialized successfully.")
-        self.clear_buffer()
-
-    def clear_buffer(self) -> None:
-        logging.info("Clearing device buffer...")
-        try:
-            while True:
-                data = self.device.read(self.ENDPOINT_IN, 128, timeout=500)
-                logging.debug(f"Cleared buffered data: {bytes(data).decode('ascii', errors='replace')}")
-        except usb.core.USBError as e:
-            if e.errno == 110 or "timeout" in str(e).lower():
-                logging.info("Device buffer cleared (no more data).")
-            else:
-                logging.error(f"USB error clearing buffer: {e}")
-
-    def send_command(self, cmd: str) -> str:
-        full_cmd = cmd.strip() + '\r'
-        logging.debug(f"Sending command: '{cmd}'")
-        self.device.write(self.ENDPOINT_OUT, full_cmd.encode('ascii'), timeout=self.TIMEOUT)
-        time.sleep(0.1)
-        response = self.device.read(self.ENDPOINT_IN, 128, timeout=self.TIMEOUT)
-        response_text = bytes(response).decode('ascii', errors='replace').strip()
-        logging.debug(f"Received response: '{response_text}'")
-        return response_text
-
-    def close(self) -> None:
-        usb.util.release_interface(self.device, self.INTERFACE)
-        usb.util.dispose_resources(self.device)
-        logging.info("Device closed properly.")
+TEST_COMMANDS = ["MDL", "VER", "VOL", "BAT", "STS",
+                 "GLG", "KEY,PSE", "KEY,SCN", "RF 1",
+                 "PM 1", "SQ", "BLT"]
 
 
 def rediscover_commands(scanner: UnidenUBC125XLT) -> dict:
-    test_commands = ["MDL", "VER", "VOL", "BAT", "STS",
-                     "GLG", "KEY,PSE", "KEY,SCN", "RF 1",
-                     "PM 1", "SQ", "BLT"]
     responses = {}
-    for cmd in test_commands:
+    for cmd in TEST_COMMANDS:
         try:
             response = scanner.send_command(cmd)
             responses[cmd] = response
             logging.info(f"Command '{cmd}' response: '{response}'")
-            time.sleep(0.2)
         except usb.core.USBError as e:
             logging.error(f"USB Error on command '{cmd}': {e}")
             responses[cmd] = f"USB Error: {e}"
+        scanner.wait_for_notification()
+    return responses
+
+
+async def rediscover_commands_async(scanner) -> dict:
+    """
+    Send all test commands back to back over libusb1 asynchronous transfers.
+
+    Every OUT transfer is queued before any completes; libusb events are handled from the
+    asyncio loop, so Python only runs when a transfer finishes. Replies are read from the
+    scanner's shared CR-framed IN stream, so long replies such as STS and the KEY
+    acknowledgements stay paired with their commands. If a reply is lost, every command
+    still waiting is reported as a USB error instead of being shifted onto the wrong reply.
+
+    Parameters:
+        scanner (UnidenAsync): Initialized asynchronous scanner.
+
+    Returns:
+        dict: Command mapped to its response or error text.
+    """
+    results = await asyncio.gather(
+        *(scanner.send_command(cmd) for cmd in TEST_COMMANDS),
+        return_exceptions=True,
+    )
+    responses = {}
+    for cmd, result in zip(TEST_COMMANDS, results):
+        if isinstance(result, Exception):
+            logging.error(f"USB Error on command '{cmd}': {result}")
+            responses[cmd] = f"USB Error: {result}"
+        else:
+            responses[cmd] = result
+            logging.info(f"Command '{cmd}' response: '{result}'")
     return responses
 
 
 def main() -> None:
-    scanner = UnidenUBC125XLT()
+    try:
+        with scanner_session() as scanner:
+            results = rediscover_commands(scanner)
+        print("\n--- Corrected Summary of Responses ---")
+        for command, response in results.items():
+            print(f"{command:<10} → {response}")
+    except Exception as e:
+        logging.error(f"An error occurred: {e}")
+
+
+async def main_async() -> None:
+    # libusb1 is only needed for the asynchronous mode.
+    from uniden_async import UnidenAsync
+
+    scanner = UnidenAsync()
     try:
         scanner.initialize()
-        results = rediscover_commands(scanner)
+        results = await rediscover_commands_async(scanner)
         print("\n--- Corrected Summary of Responses ---")
         for command, response in results.items():
             print(f"{command:<10} → {response}")
@@ -102,4 +99,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    if "--async" in sys.argv[1:]:
+        asyncio.run(main_async())
+    else:
+        main()
@@ -12,6 +12,8 @@ import sys
 import usb.core
 import usb.util
 
+from uniden_core import get_device
+
 # Setup detailed logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -24,17 +26,16 @@ class UnidenDevice:
     """
     Class representing the Uniden UBC125XLT USB device.
     """
-    VENDOR_ID = 0x1965
-    PRODUCT_ID = 0x0018
+    __slots__ = ('device',)
 
     def __init__(self) -> None:
         """
         Locate the Uniden device on the USB bus.
         Exits the program if the device is not found.
         """
-        self.device = usb.core.find(idVendor=self.VENDOR_ID, idProduct=self.PRODUCT_ID)
+        self.device = get_device()
         if self.device is None:
-            logging.error("Uniden UBC125XLT device not found. Check USB connection and device IDs.")
+            logging.error("Uniden UBC125XLT device not found. Check USB connection and device IDs in uniden_core.")
             sys.exit(1)
         logging.info("Uniden UBC125XLT device found successfully.")
 